@@ -1,32 +1,64 @@
 import argparse
-import glob
+import asyncio
+import hashlib
+import importlib.util
 import logging
 import math
 import os
+import platform
+import re
+import shutil
+import sqlite3
+import subprocess
 import sys
+import time
 import warnings
-import tempfile
-from typing import Optional, Callable
-from functools import wraps
+from typing import Any, Dict, List, Optional, Callable, Tuple
+from functools import lru_cache, wraps
 
+import httpx
 import openai
-import torch
-import yt_dlp
-from pydub import AudioSegment
 
 try:
-    import whisper
+    import mutagen
 except ImportError:
-    whisper = None
+    mutagen = None
+
+# Heavy dependencies (torch, whisper backends, yt_dlp) are imported where they are used,
+# so the OpenAI API path and --help don't pay their import time and memory.
 
 # Configuration
-openai.api_key = os.environ.get('OPENAI_API_KEY')
 log_level = os.environ.get('LOG_LEVEL', 'INFO').upper()
 logging.basicConfig(level=log_level)
 logger = logging.getLogger(__name__)
 
+OPENAI_MODEL = "whisper-1"
+DEFAULT_MAX_CONCURRENT = 5
+MAX_RETRIES = 5
+CHAIN_PROMPT_WORDS = 32
+WHISPER_BATCH_SIZE = 16
+IS_APPLE_SILICON = platform.system() == "Darwin" and platform.machine() == "arm64"
+WHISPER_BACKENDS = ['auto', 'mlx', 'faster-whisper', 'openai-whisper']
+COMPUTE_TYPES = ['int8', 'int8_float32', 'int8_float16', 'int8_bfloat16', 'int16', 'float16', 'bfloat16', 'float32']
+TRANSCRIPT_CACHE_FILE = os.path.expanduser("~/.cache/transcript_utility/transcripts.db")
+TRANSCRIPT_CACHE_MAX_ENTRIES = 100000
+YOUTUBE_CACHE_DIR = os.path.expanduser("~/.cache/transcript_utility/youtube")
+YOUTUBE_CACHE_MAX_BYTES = 2 * 1024 ** 3
+SILENCE_NOISE_DB = -30
+SILENCE_MIN_DURATION = 0.3
+
 # Decorators
 def error_handler(func: Callable) -> Callable:
+    if asyncio.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"Error in {func.__name__}: {e}")
+                raise
+        return async_wrapper
+
     @wraps(func)
     def wrapper(*args, **kwargs):
         try:
@@ -49,34 +81,175 @@ def ensure_directory(func: Callable) -> Callable:
 # Helper functions
 def ensure_dir(directory: str) -> None:
     """Create directory if it doesn't exist."""
-    if not os.path.exists(directory):
+    try:
         os.makedirs(directory)
         logger.info(f"Created directory: {directory}")
+    except FileExistsError:
+        pass
 
 def get_user_choice(prompt: str) -> bool:
     """Get user's yes/no choice."""
     return input(prompt).lower().strip() == 'y'
 
+def is_installed(module_name: str) -> bool:
+    """Check whether a module can be imported, without importing it."""
+    return importlib.util.find_spec(module_name) is not None
+
+def parse_time(value: str) -> float:
+    """Parse a time given as seconds, MM:SS or HH:MM:SS into seconds."""
+    seconds = 0.0
+    for part in value.split(':'):
+        seconds = seconds * 60 + float(part)
+    return seconds
+
+def positive_int(value: str) -> int:
+    """Parse an integer of at least 1 for argparse."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+def get_available_cores() -> int:
+    """Count the physical cores this process may run on, honouring CPU affinity and a cgroup v2 CPU quota."""
+    try:
+        # SMT siblings share a core's execution units, so count distinct (package, core) pairs
+        cores = set()
+        for cpu in os.sched_getaffinity(0):
+            topology = f'/sys/devices/system/cpu/cpu{cpu}/topology'
+            with open(f'{topology}/physical_package_id', 'r') as f:
+                package_id = f.read().strip()
+            with open(f'{topology}/core_id', 'r') as f:
+                cores.add((package_id, f.read().strip()))
+        cpus = len(cores)
+    except (AttributeError, OSError):  # No sched_getaffinity or sysfs topology outside Linux
+        cpus = max(1, (os.cpu_count() or 1) // 2)
+    try:
+        with open('/sys/fs/cgroup/cpu.max', 'r') as f:
+            quota, period = f.read().split()
+        if quota != 'max':
+            cpus = min(cpus, max(1, math.ceil(int(quota) / int(period))))
+    except (OSError, ValueError):
+        pass
+    return cpus
+
 def get_output_file_path(output_dir: str, base_name: str, extension: str) -> str:
     """Generate output file path."""
     return os.path.join(output_dir, f"{base_name}.{extension}")
 
+def get_chunk_transcript_path(output_dir: str, base_name: str, chunk_index: int) -> str:
+    """Generate the transcript path of a single chunk."""
+    return get_output_file_path(output_dir, f'{base_name}_chunk_{chunk_index}', "txt")
+
+def link_or_copy(src: str, dst: str) -> None:
+    """Hardlink src to dst, copying when they are on different filesystems."""
+    if os.path.exists(dst):
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+def get_youtube_video_id(source_url: str) -> Optional[str]:
+    """Extract the 11-character video ID from a YouTube URL, or None if there is none."""
+    match = re.search(r'(?:[?&]v=|youtu\.be/|/shorts/|/embed/|/live/)([\w-]{11})', source_url)
+    return match.group(1) if match else None
+
+# Audio helpers
+def get_audio_duration_ms(audio_file_path: str) -> int:
+    """Read audio duration from the file header with mutagen, falling back to ffprobe."""
+    if mutagen is not None:
+        try:
+            audio = mutagen.File(audio_file_path)
+        except mutagen.MutagenError:
+            audio = None
+        if audio is not None and audio.info.length:
+            return int(audio.info.length * 1000)
+
+    result = subprocess.run(
+        ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
+         '-of', 'default=noprint_wrappers=1:nokey=1', audio_file_path],
+        capture_output=True, text=True, check=True
+    )
+    return int(float(result.stdout) * 1000)
+
+def read_audio_chunk(audio_file_path: str, start_ms: int, length_ms: int) -> Tuple[str, bytes, str]:
+    """Extract a slice of audio as a (file name, content, MIME type) upload, seeking with ffmpeg."""
+    if os.path.splitext(audio_file_path)[1].lower() == '.mp3':
+        # Copy MP3 frames as-is: no re-encode, and the upload stays ~10x smaller than WAV
+        output_args = ['-c:a', 'copy', '-f', 'mp3']
+        file_name, mime_type = "chunk.mp3", "audio/mpeg"
+    else:
+        # AAC in M4A can't be stream-copied to a pipe, so fall back to compact 16 kHz mono WAV
+        output_args = ['-ar', '16000', '-ac', '1', '-c:a', 'pcm_s16le', '-f', 'wav']
+        file_name, mime_type = "chunk.wav", "audio/wav"
+
+    result = subprocess.run(
+        ['ffmpeg', '-nostdin', '-v', 'error',
+         '-ss', str(start_ms / 1000), '-t', str(length_ms / 1000), '-i', audio_file_path,
+         '-vn', *output_args, 'pipe:1'],
+        capture_output=True, check=True
+    )
+    return file_name, result.stdout, mime_type
+
+def detect_silences(audio_file_path: str) -> List[Tuple[int, int]]:
+    """Find pauses in the audio as (start ms, end ms) pairs with ffmpeg's silencedetect filter."""
+    result = subprocess.run(
+        ['ffmpeg', '-nostdin', '-hide_banner', '-nostats', '-i', audio_file_path, '-vn',
+         '-af', f'silencedetect=noise={SILENCE_NOISE_DB}dB:d={SILENCE_MIN_DURATION}', '-f', 'null', '-'],
+        capture_output=True, text=True, check=True
+    )
+    starts = [float(t) for t in re.findall(r'silence_start: (-?[\d.]+)', result.stderr)]
+    ends = [float(t) for t in re.findall(r'silence_end: ([\d.]+)', result.stderr)]
+    return [(int(start * 1000), int(end * 1000)) for start, end in zip(starts, ends)]
+
+def get_chunk_ranges(audio_file_path: str, duration_ms: int, chunk_length_ms: int,
+                     split_on_silence: bool = True) -> List[Tuple[int, int]]:
+    """Split the audio into (start ms, length ms) chunks of at most chunk_length_ms, cut at pauses if asked."""
+    silences = detect_silences(audio_file_path) if split_on_silence else []
+    ranges = []
+    start = 0
+    while start < duration_ms:
+        end = min(start + chunk_length_ms, duration_ms)
+        if end < duration_ms:
+            # Cut in the middle of the longest pause in the second half of the chunk instead of mid-word
+            pauses = [(silence_end - silence_start, (silence_start + silence_end) // 2)
+                      for silence_start, silence_end in silences
+                      if start + chunk_length_ms // 2 < (silence_start + silence_end) // 2 <= end]
+            if pauses:
+                end = max(pauses)[1]
+        ranges.append((start, end - start))
+        start = end
+    return ranges
+
 # YouTube downloader
 class YouTubeDownloader:
     @staticmethod
     @error_handler
     @ensure_directory
-    def download(source_url: str, base_name: str, force_download: bool = False) -> str:
-        """Download audio from YouTube URL."""
+    def download(source_url: str, base_name: str, force_download: bool = False,
+                 start_time: Optional[float] = None, end_time: Optional[float] = None,
+                 use_download_cache: bool = True) -> str:
+        """Download audio from YouTube URL, optionally only the section between start_time and end_time."""
         output_dir = base_name
         output_file = get_output_file_path(output_dir, base_name, "mp3")
 
-        if os.path.exists(output_file) and not force_download:
-            if get_user_choice(f"{output_file} already exists. Use existing file? (y/n): "):
-                logger.info(f"Using existing file: {output_file}")
+        # Audio is cached by video ID (and section), so a rerun under another base name skips the download
+        cache_file = YouTubeDownloader._get_cache_file(source_url, start_time, end_time) if use_download_cache else None
+        if not force_download:
+            if os.path.exists(output_file):
+                if get_user_choice(f"{output_file} already exists. Use existing file? (y/n): "):
+                    logger.info(f"Using existing file: {output_file}")
+                    return output_file
+            elif cache_file and os.path.exists(cache_file):
+                ensure_dir(output_dir)
+                link_or_copy(cache_file, output_file)
+                os.utime(cache_file)  # Mark as recently used for eviction
+                logger.info(f"Using cached download: {cache_file}")
                 return output_file
 
-        ydl_opts = YouTubeDownloader._get_ydl_opts(output_dir)
+        ydl_opts = YouTubeDownloader._get_ydl_opts(output_dir, start_time, end_time)
+
+        import yt_dlp
 
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
             logger.info(f"Downloading audio from: {source_url}")
@@ -96,13 +269,45 @@ class YouTubeDownloader:
         if not os.path.exists(output_file):
             raise FileNotFoundError(f"Failed to download audio from {source_url}. Output file not found: {output_file}")
 
+        if cache_file:
+            ensure_dir(YOUTUBE_CACHE_DIR)
+            link_or_copy(output_file, cache_file)
+            os.utime(cache_file)  # yt-dlp sets mtime to the upload date, which would make it look least recently used
+            YouTubeDownloader._evict_cache()
+
         logger.info(f"Audio file downloaded successfully: {output_file}")
         return output_file
 
     @staticmethod
-    def _get_ydl_opts(output_dir: str) -> dict:
+    def _get_cache_file(source_url: str, start_time: Optional[float] = None,
+                        end_time: Optional[float] = None) -> Optional[str]:
+        """Get the download cache path of a video section, or None if the URL has no video ID."""
+        video_id = get_youtube_video_id(source_url)
+        if video_id is None:
+            return None
+        if start_time is not None or end_time is not None:
+            video_id += f"_{start_time or 0:g}-" + (f"{end_time:g}" if end_time is not None else "end")
+        return os.path.join(YOUTUBE_CACHE_DIR, f"{video_id}.mp3")
+
+    @staticmethod
+    def _evict_cache(max_bytes: int = YOUTUBE_CACHE_MAX_BYTES) -> None:
+        """Delete the least recently used cached downloads until the cache fits in max_bytes."""
+        entries = sorted((entry.stat().st_mtime, entry.stat().st_size, entry.path)
+                         for entry in os.scandir(YOUTUBE_CACHE_DIR) if entry.is_file())
+        total = sum(size for _, size, _ in entries)
+        # Always keep the newest entry, even when it alone is over the limit
+        for _, size, path in entries[:-1]:
+            if total <= max_bytes:
+                break
+            os.remove(path)
+            total -= size
+            logger.info(f"Evicted cached download: {path}")
+
+    @staticmethod
+    def _get_ydl_opts(output_dir: str, start_time: Optional[float] = None,
+                      end_time: Optional[float] = None) -> dict:
         """Get YouTube downloader options."""
-        return {
+        ydl_opts = {
             'format': 'bestaudio/best',
             'postprocessors': [{
                 'key': 'FFmpegExtractAudio',
@@ -118,53 +323,210 @@ class YouTubeDownloader:
             'logger': logger,
         }
 
+        if start_time is not None or end_time is not None:
+            from yt_dlp.utils import download_range_func
+
+            # Fetch only the requested section instead of downloading and transcoding the whole video
+            section = (start_time or 0, end_time if end_time is not None else math.inf)
+            ydl_opts['download_ranges'] = download_range_func(None, [section])
+            ydl_opts['force_keyframes_at_cuts'] = True
+
+        return ydl_opts
+
 # Transcription
 class Transcriber:
     @staticmethod
     @error_handler
-    def transcribe(file_path: str, whisper_model: Optional[str] = None) -> str:
-        """Transcribe audio using either local Whisper model or OpenAI API."""
-        if whisper_model:
-            return Transcriber._transcribe_with_whisper(file_path, whisper_model)
-        else:
-            return Transcriber._transcribe_with_openai(file_path)
+    async def transcribe(audio: Tuple[str, bytes, str], client: openai.AsyncOpenAI,
+                         prompt: Optional[str] = None) -> str:
+        """Transcribe an audio chunk upload using OpenAI API, optionally seeded with a prompt."""
+        return await Transcriber._transcribe_with_openai(audio, client, prompt)
 
     @staticmethod
-    def _transcribe_with_whisper(file_path: str, model_name: str) -> str:
-        """Transcribe using local Whisper model."""
-        if whisper is None:
-            raise ImportError("whisper module not found. Install with: pip install openai-whisper")
+    def create_client(max_concurrent: int = DEFAULT_MAX_CONCURRENT) -> openai.AsyncOpenAI:
+        """Create an OpenAI client whose HTTP/2 connection pool is shared by all chunks."""
+        # httpx needs the optional h2 package for HTTP/2; without it chunks share HTTP/1.1 keep-alive connections
+        http2 = is_installed("h2")
+        if not http2:
+            logger.warning("h2 is not installed, using HTTP/1.1. Install with: pip install 'httpx[http2]'")
+        http_client = openai.DefaultAsyncHttpxClient(
+            http2=http2,
+            limits=httpx.Limits(max_connections=max_concurrent, max_keepalive_connections=max_concurrent)
+        )
+        # The SDK retries connection errors, timeouts, 408/409/429 and 5xx, honouring retry-after on 429
+        return openai.AsyncOpenAI(http_client=http_client, max_retries=MAX_RETRIES)
 
+    @staticmethod
+    @error_handler
+    def transcribe_file(file_path: str, whisper_model: str, fp16: Optional[bool] = None,
+                        quantize: Optional[bool] = None, backend: str = 'auto', compile_model: bool = False,
+                        compute_type: Optional[str] = None) -> str:
+        """Transcribe a whole audio file using local Whisper model."""
+        return Transcriber._transcribe_with_whisper(file_path, whisper_model, fp16, quantize, backend, compile_model,
+                                                    compute_type)
+
+    @staticmethod
+    def _get_whisper_backend() -> str:
+        """Pick the fastest installed Whisper backend: MLX on Apple Silicon, then faster-whisper."""
+        if IS_APPLE_SILICON and is_installed("mlx_whisper"):
+            return 'mlx'
+        if is_installed("faster_whisper"):
+            return 'faster-whisper'
+        if is_installed("whisper"):
+            return 'openai-whisper'
+        raise ImportError("whisper module not found. Install with: pip install faster-whisper")
+
+    @staticmethod
+    def _transcribe_with_whisper(file_path: str, model_name: str, fp16: Optional[bool] = None,
+                                 quantize: Optional[bool] = None, backend: str = 'auto',
+                                 compile_model: bool = False, compute_type: Optional[str] = None) -> str:
+        """Transcribe using local Whisper model with the given backend."""
+        if backend == 'auto':
+            backend = Transcriber._get_whisper_backend()
+        if backend == 'mlx':
+            return Transcriber._transcribe_with_mlx(file_path, model_name)
+        if backend == 'faster-whisper':
+            return Transcriber._transcribe_with_faster_whisper(file_path, model_name, compute_type)
+
+        # Share compiled kernels across runs so only the first one pays the torch.compile warmup
+        os.environ.setdefault("TORCHINDUCTOR_CACHE_DIR", os.path.expanduser("~/.cache/transcript_utility/inductor"))
+        os.environ.setdefault("TORCHINDUCTOR_FX_GRAPH_CACHE", "1")
+        import torch
+
+        torch.set_float32_matmul_precision("high")  # Allow TF32 matmuls on Ampere and newer GPUs
         logger.info(f"Transcribing with local Whisper model: {model_name}")
         with warnings.catch_warnings():
             warnings.filterwarnings("ignore", category=FutureWarning, module="torch.serialization")
             warnings.filterwarnings("ignore", category=UserWarning)
 
-            device = "mps" if torch.backends.mps.is_available() else "cpu"
-            logger.info(f"Using device: {device}")
+            if torch.cuda.is_available():
+                device = "cuda"
+            elif torch.backends.mps.is_available():
+                device = "mps"
+            else:
+                device = "cpu"
+            # Half precision only pays off on GPUs; on CPU it falls back to FP32 anyway
+            if fp16 is None:
+                fp16 = device != "cpu"
+            logger.info(f"Using device: {device} ({'fp16' if fp16 else 'fp32'})")
+
+            # int8 dynamic quantization decodes a 30 s window ~1.3x faster on CPU; MPS int8 kernels are unreliable
+            if quantize is None:
+                quantize = device == "cpu"
+
+            model = Transcriber._get_whisper_model(model_name, device, quantize and device == "cpu", compile_model)
+            # Whisper windows long audio internally, carrying context across 30 s windows
+            result = model.transcribe(file_path, fp16=fp16, condition_on_previous_text=True)
+
+        return result["text"]
+
+    @staticmethod
+    @lru_cache(maxsize=2)
+    def _get_whisper_model(model_name: str, device: str, quantize: bool = False, compile_model: bool = False) -> Any:
+        """Load a Whisper model, optionally compiled with torch.compile, cached across files."""
+        import torch
+        import whisper
+
+        model = whisper.load_model(model_name, device=device)
+        if quantize:
+            model = Transcriber._quantize_linear_layers(model)
+        if compile_model and quantize:
+            # Dynamo can't trace the packed int8 weights as one graph, and compiling gained nothing over int8 eager
+            logger.info("Skipping torch.compile for the int8 quantized model, use --no-quantize to compile")
+            compile_model = False
+        # Inductor has no MPS backend, so compilation is limited to CPU and CUDA
+        if compile_model and hasattr(torch, 'compile') and device != "mps":
+            logger.info("Compiling Whisper model, the first window includes warmup time")
+            model.encoder.forward = torch.compile(model.encoder.forward, mode="reduce-overhead", fullgraph=True)
+            # The decoder's kv-cache hooks cause graph breaks, so it can't be compiled as one graph
+            model.decoder.forward = torch.compile(model.decoder.forward, mode="reduce-overhead")
+        return model
+
+    @staticmethod
+    def _quantize_linear_layers(model: Any) -> Any:
+        """Dynamically quantize a Whisper model's linear layers to int8."""
+        import torch
+        from whisper.model import Linear as WhisperLinear
+
+        # quantize_dynamic matches layers by exact type, so whisper's Linear subclass must become nn.Linear first
+        for module in list(model.modules()):
+            for name, child in module.named_children():
+                if isinstance(child, WhisperLinear):
+                    linear = torch.nn.Linear(child.in_features, child.out_features, bias=child.bias is not None,
+                                             device="meta")
+                    linear.weight = child.weight
+                    linear.bias = child.bias
+                    setattr(module, name, linear)
+
+        size_before = sum(p.numel() * p.element_size() for p in model.parameters())
+        logger.info("Quantizing Whisper model linear layers to int8")
+        model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        # Quantized layers keep packed int8 weights outside parameters(), so the float parameters shrink
+        size_after = sum(p.numel() * p.element_size() for p in model.parameters())
+        if size_after >= size_before:
+            logger.warning("No linear layers were quantized, running the Whisper model in full precision")
+        else:
+            logger.info(f"Float parameters reduced from {size_before / 2**20:.0f} MiB to {size_after / 2**20:.0f} MiB")
+        return model
 
-            model = whisper.load_model(model_name, device=device)
-            result = model.transcribe(file_path, fp16=False)
+    @staticmethod
+    def _transcribe_with_mlx(file_path: str, model_name: str) -> str:
+        """Transcribe using MLX Whisper on Apple Silicon."""
+        import mlx_whisper
 
+        logger.info(f"Transcribing with MLX Whisper model: {model_name}")
+        repo_name = "large-v3" if model_name == "large" else model_name
+        result = mlx_whisper.transcribe(file_path, path_or_hf_repo=f"mlx-community/whisper-{repo_name}-mlx")
         return result["text"]
 
     @staticmethod
-    def _transcribe_with_openai(file_path: str) -> str:
+    def _transcribe_with_faster_whisper(file_path: str, model_name: str, compute_type: Optional[str] = None) -> str:
+        """Transcribe using faster-whisper (CTranslate2), with int8 weights unless compute_type says otherwise."""
+        logger.info(f"Transcribing with faster-whisper model: {model_name}")
+        pipeline = Transcriber._get_faster_whisper_pipeline(model_name, compute_type)
+        # Speech segments are batched through the encoder and decoder together
+        segments, _ = pipeline.transcribe(file_path, beam_size=5, vad_filter=True, batch_size=WHISPER_BATCH_SIZE)
+        return ''.join(segment.text for segment in segments)
+
+    @staticmethod
+    @lru_cache(maxsize=2)
+    def _get_faster_whisper_pipeline(model_name: str, compute_type: Optional[str] = None) -> Any:
+        """Load a batched faster-whisper pipeline, cached across files."""
+        import ctranslate2
+        from faster_whisper import BatchedInferencePipeline, WhisperModel
+
+        cuda = ctranslate2.get_cuda_device_count() > 0
+        if compute_type is None:
+            compute_type = "int8_float16" if cuda else "int8"
+        logger.info(f"Using device: {'cuda' if cuda else 'cpu'} ({compute_type})")
+        # CTranslate2 defaults to 4 CPU threads, so use one per available physical core instead,
+        # unless OMP_NUM_THREADS is set: a non-zero cpu_threads would override it
+        cpu_threads = 0 if cuda or 'OMP_NUM_THREADS' in os.environ else get_available_cores()
+        model = WhisperModel(model_name, device="auto", compute_type=compute_type, cpu_threads=cpu_threads)
+        return BatchedInferencePipeline(model=model)
+
+    @staticmethod
+    async def _transcribe_with_openai(audio: Tuple[str, bytes, str], client: openai.AsyncOpenAI,
+                                      prompt: Optional[str] = None) -> str:
         """Transcribe using OpenAI API."""
         logger.info("Transcribing with OpenAI API")
-        with open(file_path, 'rb') as audio_file:
-            transcript = openai.Audio.transcribe(
-                model="whisper-1",
-                file=audio_file,
-                response_format="text"
-            )
-        return transcript
+        return await client.audio.transcriptions.create(
+            model=OPENAI_MODEL,
+            file=audio,
+            prompt=prompt or openai.NOT_GIVEN,
+            response_format="text"
+        )
 
 # Main functions
 @error_handler
 @ensure_directory
 def mp3_to_transcript(audio_file_path: str, base_name: str = '',
-                      chunk_length_ms: int = 60000, whisper_model: Optional[str] = None) -> str:
+                      chunk_length_ms: int = 60000, whisper_model: Optional[str] = None,
+                      max_concurrent: int = DEFAULT_MAX_CONCURRENT, fp16: Optional[bool] = None,
+                      keep_intermediate: bool = False, quantize: Optional[bool] = None,
+                      backend: str = 'auto', compile_model: bool = False, use_cache: bool = True,
+                      split_on_silence: bool = True, compute_type: Optional[str] = None,
+                      chain_prompts: bool = False) -> str:
     """Convert MP3, WAV, or M4A to transcript."""
     if not os.path.exists(audio_file_path):
         raise FileNotFoundError(f"Audio file not found: {audio_file_path}")
@@ -173,98 +535,282 @@ def mp3_to_transcript(audio_file_path: str, base_name: str = '',
     output_dir = base_name
     os.makedirs(output_dir, exist_ok=True)  # Ensure output directory exists
     final_transcript_file = get_output_file_path(output_dir, base_name, "txt")
+    progress_file = get_output_file_path(output_dir, base_name, "progress")
 
-    if os.path.exists(final_transcript_file):
+    # A progress file means the transcript is only partially written
+    if os.path.exists(final_transcript_file) and not os.path.exists(progress_file):
         if get_user_choice(f"Transcript file {final_transcript_file} already exists. Use existing file? (y/n): "):
             logger.info(f"Using existing transcript file: {final_transcript_file}")
             return final_transcript_file
 
     logger.info(f"Processing audio file: {audio_file_path}")
     audio_format = os.path.splitext(audio_file_path)[1].lower()
-    if audio_format in ['.mp3', '.wav', '.m4a']:
-        audio = AudioSegment.from_file(audio_file_path, format=audio_format[1:])
-    else:
+    if audio_format not in ['.mp3', '.wav', '.m4a']:
         raise ValueError(f"Unsupported audio format: {audio_format}")
 
-    chunks = math.ceil(len(audio) / chunk_length_ms)
+    if whisper_model:
+        # Local Whisper handles long-form audio itself, so only the API path (25 MB upload limit) is chunked
+        transcript = Transcriber.transcribe_file(audio_file_path, whisper_model, fp16, quantize, backend,
+                                                 compile_model, compute_type)
+        with open(final_transcript_file, 'w', encoding='utf-8') as f:
+            f.write(transcript)
+        # The transcript is complete, so progress left by an interrupted API run no longer applies
+        if os.path.exists(progress_file):
+            os.remove(progress_file)
+        logger.info(f"Full transcript saved to {final_transcript_file}")
+        return final_transcript_file
+
+    chunk_ranges = get_chunk_ranges(audio_file_path, get_audio_duration_ms(audio_file_path), chunk_length_ms,
+                                    split_on_silence)
+    chunks = len(chunk_ranges)
     logger.info(f'Total chunks: {chunks}')
 
-    existing_chunks = sorted(glob.glob(os.path.join(output_dir, f'{base_name}_chunk_*.txt')))
-    start_chunk = len(existing_chunks)
-
-    for i in range(start_chunk, chunks):
-        process_audio_chunk(audio, i, chunk_length_ms, output_dir, base_name, whisper_model)
-
-    combine_transcripts(output_dir, base_name, final_transcript_file)
+    # Progress and kept chunks only apply to the same chunk boundaries, which depend on the split settings
+    layout = hashlib.sha256(repr((split_on_silence, chunk_length_ms, chunk_ranges)).encode()).hexdigest()[:16]
+    next_chunk, offset = read_progress(progress_file, final_transcript_file, layout)
+    if next_chunk:
+        logger.info(f"Resuming from chunk {next_chunk}")
+
+    # Chunk transcripts kept by an interrupted --keep-intermediate run don't need transcribing again,
+    # but ones left by a finished run may belong to other audio or other chunk boundaries
+    existing_files = set(os.listdir(output_dir))
+    if not next_chunk:
+        chunk_file_pattern = re.compile(rf'{re.escape(base_name)}_chunk_\d+\.txt')
+        for name in existing_files:
+            if chunk_file_pattern.fullmatch(name):
+                os.remove(os.path.join(output_dir, name))
+        existing_files.clear()
+
+    with TranscriptWriter(final_transcript_file, progress_file, layout, next_chunk, offset) as writer:
+        pending_chunks = []
+        for i in range(next_chunk, chunks):
+            chunk_transcript_path = get_chunk_transcript_path(output_dir, base_name, i)
+            if os.path.basename(chunk_transcript_path) in existing_files:
+                with open(chunk_transcript_path, 'r', encoding='utf-8') as f:
+                    writer.add(i, f.read())
+            else:
+                pending_chunks.append(i)
+
+        asyncio.run(transcribe_chunks(audio_file_path, pending_chunks, chunk_ranges, output_dir, base_name,
+                                      max_concurrent, writer, keep_intermediate, use_cache, chain_prompts))
+
+    if os.path.exists(progress_file):
+        os.remove(progress_file)
+    logger.info(f"Full transcript saved to {final_transcript_file}")
 
     return final_transcript_file
 
-def process_audio_chunk(audio: AudioSegment, chunk_index: int, chunk_length_ms: int,
-                        output_dir: str, base_name: str, whisper_model: Optional[str]) -> None:
-    """Process a single audio chunk."""
-    start_time = chunk_index * chunk_length_ms
-    end_time = start_time + chunk_length_ms
-    chunk = audio[start_time:end_time]
-
-    # Ensure the output directory exists
-    os.makedirs(output_dir, exist_ok=True)
-
-    # Use a temporary file with the original audio format
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-        chunk_file_path = temp_file.name
-        chunk.export(chunk_file_path, format="wav")
-
-    chunk_transcript_path = get_output_file_path(output_dir, f'{base_name}_chunk_{chunk_index}', "txt")
-
-    logger.debug(f'Processing chunk: {chunk_file_path}')
-
-    transcript = Transcriber.transcribe(chunk_file_path, whisper_model)
-    with open(chunk_transcript_path, 'w', encoding='utf-8') as f:
-        f.write(transcript)
-
-    print(f"Chunk {chunk_index} transcript:")
-    print(transcript)
-    print("------------------------")
+def read_progress(progress_file: str, transcript_file: str, layout: str) -> Tuple[int, int]:
+    """Read the next chunk index and transcript size recorded by an interrupted run with the same chunk layout."""
+    if not os.path.exists(progress_file):
+        return 0, 0
+    with open(progress_file, 'r', encoding='utf-8') as f:
+        fields = f.read().split()
+    if len(fields) != 3 or fields[2] != layout:
+        logger.warning(f"{progress_file} was recorded with different chunk boundaries, starting over")
+        return 0, 0
+    next_chunk, offset = int(fields[0]), int(fields[1])
+    # Truncating a missing or shortened transcript up to offset would pad it with NUL bytes
+    transcript_size = os.path.getsize(transcript_file) if os.path.exists(transcript_file) else 0
+    if transcript_size < offset:
+        logger.warning(f"{transcript_file} is missing or shorter than recorded in {progress_file}, starting over")
+        return 0, 0
+    return next_chunk, offset
+
+class TranscriptWriter:
+    """Append chunk transcripts to the final transcript in chunk order, recording progress for resume."""
+
+    def __init__(self, transcript_file: str, progress_file: str, layout: str, next_chunk: int = 0, offset: int = 0):
+        self.transcript_file = transcript_file
+        self.progress_file = progress_file
+        self.layout = layout
+        self.next_chunk = next_chunk
+        self.offset = offset
+        self.pending: Dict[int, str] = {}
+        self.last_transcript = ''
+        if offset:
+            # On resume, the end of the transcript so far stands in for the last chunk (e.g. for prompt chaining)
+            with open(transcript_file, 'rb') as f:
+                f.seek(max(0, offset - 4096))
+                self.last_transcript = f.read(offset - f.tell()).decode('utf-8', errors='ignore')
+        # Opened on the first in-order chunk, so a run that fails before then leaves the old transcript alone
+        self.file: Optional[Any] = None
+
+    def __enter__(self) -> 'TranscriptWriter':
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        if self.file is None and exc_type is None:
+            self._open()  # No chunks to write, still leave the (empty) transcript behind
+        if self.file is not None:
+            self.file.close()
+
+    def _open(self) -> None:
+        """Open the transcript for appending after the last recorded progress."""
+        self.file = open(self.transcript_file, 'ab')
+        # Drop anything written after the last recorded progress, e.g. by a previous full run
+        self.file.truncate(self.offset)
+        self.file.seek(self.offset)
+
+    def add(self, chunk_index: int, transcript: str) -> None:
+        """Queue a chunk transcript and append every chunk that is now in order."""
+        self.pending[chunk_index] = transcript
+        if self.next_chunk not in self.pending:
+            return
+        if self.file is None:
+            self._open()
+        while self.next_chunk in self.pending:
+            if self.next_chunk:
+                self.file.write(b'\n')
+            self.last_transcript = self.pending.pop(self.next_chunk)
+            self.file.write(self.last_transcript.encode('utf-8'))
+            self.next_chunk += 1
+        self.file.flush()
+        self._save_progress()
+
+    def _save_progress(self) -> None:
+        """Atomically record the next chunk index, the transcript size and the chunk layout."""
+        temp_file = f"{self.progress_file}.tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            f.write(f"{self.next_chunk} {self.file.tell()} {self.layout}")
+        os.replace(temp_file, self.progress_file)
+
+class TranscriptCache:
+    """SQLite cache of chunk transcripts keyed by a hash of the uploaded audio, evicting least recently used."""
+
+    def __init__(self, cache_file: str = TRANSCRIPT_CACHE_FILE, max_entries: int = TRANSCRIPT_CACHE_MAX_ENTRIES):
+        ensure_dir(os.path.dirname(cache_file))
+        self.max_entries = max_entries
+        self.conn = sqlite3.connect(cache_file)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        with self.conn:
+            self.conn.execute("CREATE TABLE IF NOT EXISTS transcripts "
+                              "(key TEXT PRIMARY KEY, text TEXT NOT NULL, last_used REAL NOT NULL)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS transcripts_last_used ON transcripts (last_used)")
+
+    def close(self) -> None:
+        self.conn.close()
 
-    os.remove(chunk_file_path)
-
-def combine_transcripts(output_dir: str, base_name: str, final_transcript_file: str) -> None:
-    """Combine all chunk transcripts into a single file."""
-    all_chunk_transcripts = sorted(glob.glob(os.path.join(output_dir, f'{base_name}_chunk_*.txt')))
-    full_transcript = []
-    for chunk_file in all_chunk_transcripts:
-        with open(chunk_file, 'r', encoding='utf-8') as f:
-            full_transcript.append(f.read())
-
-    with open(final_transcript_file, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(full_transcript))
+    @staticmethod
+    def get_key(audio: bytes, prompt: Optional[str] = None) -> str:
+        """Build the cache key of an audio upload and the prompt it is sent with."""
+        digest = hashlib.sha256(audio)
+        if prompt:
+            digest.update(b'\0' + prompt.encode('utf-8'))
+        return f"{OPENAI_MODEL}:{digest.hexdigest()}"
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached transcript, or None on a miss."""
+        row = self.conn.execute("SELECT text FROM transcripts WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        with self.conn:
+            self.conn.execute("UPDATE transcripts SET last_used = ? WHERE key = ?", (time.time(), key))
+        return row[0]
+
+    def put(self, key: str, text: str) -> None:
+        """Cache a transcript, dropping the least recently used entries beyond max_entries."""
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO transcripts (key, text, last_used) VALUES (?, ?, ?)",
+                              (key, text, time.time()))
+            self.conn.execute("DELETE FROM transcripts WHERE last_used < "
+                              "(SELECT last_used FROM transcripts ORDER BY last_used DESC LIMIT 1 OFFSET ?)",
+                              (self.max_entries - 1,))
+
+async def transcribe_chunks(audio_file_path: str, chunk_indices: List[int], chunk_ranges: List[Tuple[int, int]],
+                            output_dir: str, base_name: str, max_concurrent: int,
+                            writer: TranscriptWriter, keep_intermediate: bool = False,
+                            use_cache: bool = True, chain_prompts: bool = False) -> None:
+    """Transcribe audio chunks concurrently, at most max_concurrent at a time, or in order when chaining prompts."""
+    semaphore = asyncio.Semaphore(max_concurrent)
+    cache = TranscriptCache() if use_cache else None
+    try:
+        async with Transcriber.create_client(max_concurrent) as client:
+            if chain_prompts:
+                # Each chunk is prompted with the end of the previous one, so earlier chunks must finish first
+                for i in chunk_indices:
+                    prompt = ' '.join(writer.last_transcript.split()[-CHAIN_PROMPT_WORDS:])
+                    await process_audio_chunk(audio_file_path, i, chunk_ranges[i], output_dir, base_name, semaphore,
+                                              client, writer, keep_intermediate, cache, prompt)
+                return
+            # Let the other chunks finish when one fails, so their progress is saved for resume
+            results = await asyncio.gather(*(
+                process_audio_chunk(audio_file_path, i, chunk_ranges[i], output_dir, base_name, semaphore,
+                                    client, writer, keep_intermediate, cache)
+                for i in chunk_indices
+            ), return_exceptions=True)
+    finally:
+        if cache:
+            cache.close()
+    errors = [result for result in results if isinstance(result, Exception)]
+    if errors:
+        raise errors[0]
+
+async def process_audio_chunk(audio_file_path: str, chunk_index: int, chunk_range: Tuple[int, int],
+                              output_dir: str, base_name: str, semaphore: asyncio.Semaphore,
+                              client: openai.AsyncOpenAI, writer: TranscriptWriter,
+                              keep_intermediate: bool = False, cache: Optional[TranscriptCache] = None,
+                              prompt: Optional[str] = None) -> None:
+    """Process a single audio chunk."""
+    async with semaphore:
+        audio = await asyncio.to_thread(read_audio_chunk, audio_file_path, *chunk_range)
+
+        logger.debug(f'Processing chunk {chunk_index}: {len(audio[1])} bytes')
+
+        # Identical audio (a re-download, a renamed output) is served from the cache without an API call
+        cache_key = TranscriptCache.get_key(audio[1], prompt)
+        transcript = cache.get(cache_key) if cache else None
+        if transcript is None:
+            transcript = await Transcriber.transcribe(audio, client, prompt)
+            if cache:
+                cache.put(cache_key, transcript)
+        else:
+            logger.info(f"Using cached transcript for chunk {chunk_index}")
 
-    logger.info(f"Full transcript saved to {final_transcript_file}")
+        if keep_intermediate:
+            chunk_transcript_path = get_chunk_transcript_path(output_dir, base_name, chunk_index)
+            with open(chunk_transcript_path, 'w', encoding='utf-8') as f:
+                f.write(transcript)
+        writer.add(chunk_index, transcript)
 
-    for chunk_file in all_chunk_transcripts:
-        os.remove(chunk_file)
+        logger.info(f"Chunk {chunk_index} transcribed: {len(transcript)} chars")
+        # Lazy formatting: the full text is only formatted when debug logging is on
+        logger.debug("Chunk %d transcript:\n%s", chunk_index, transcript)
 
 @error_handler
 @ensure_directory
 def youtube_to_transcript(source_url: str, base_name: str = '',
-                          whisper_model: Optional[str] = None, force_download: bool = False) -> str:
+                          whisper_model: Optional[str] = None, force_download: bool = False,
+                          max_concurrent: int = DEFAULT_MAX_CONCURRENT, fp16: Optional[bool] = None,
+                          keep_intermediate: bool = False, quantize: Optional[bool] = None,
+                          backend: str = 'auto', compile_model: bool = False, use_cache: bool = True,
+                          split_on_silence: bool = True, compute_type: Optional[str] = None,
+                          chain_prompts: bool = False, start_time: Optional[float] = None,
+                          end_time: Optional[float] = None, use_download_cache: bool = True) -> str:
     """Convert YouTube video to transcript."""
     logger.info("Checking for existing transcript...")
     base_name = base_name or os.path.splitext(os.path.basename(source_url))[0]
 
     output_dir = base_name
     final_transcript_file = get_output_file_path(output_dir, base_name, "txt")
+    progress_file = get_output_file_path(output_dir, base_name, "progress")
 
-    if os.path.exists(final_transcript_file):
+    if os.path.exists(final_transcript_file) and not os.path.exists(progress_file):
         if get_user_choice(f"Transcript file {final_transcript_file} already exists. Use existing file? (y/n): "):
             logger.info(f"Using existing transcript file: {final_transcript_file}")
             return final_transcript_file
 
     logger.info("Downloading and converting YouTube video to audio...")
-    audio_file = YouTubeDownloader.download(source_url, base_name, force_download=force_download)
+    audio_file = YouTubeDownloader.download(source_url, base_name, force_download=force_download,
+                                            start_time=start_time, end_time=end_time,
+                                            use_download_cache=use_download_cache)
     logger.info(f"Audio file: {audio_file}")
     logger.info("Transcribing audio...")
-    return mp3_to_transcript(audio_file, base_name, whisper_model=whisper_model)
+    return mp3_to_transcript(audio_file, base_name, whisper_model=whisper_model, max_concurrent=max_concurrent,
+                             fp16=fp16, keep_intermediate=keep_intermediate, quantize=quantize, backend=backend,
+                             compile_model=compile_model, use_cache=use_cache,
+                             split_on_silence=split_on_silence, compute_type=compute_type,
+                             chain_prompts=chain_prompts)
 
 def main():
     parser = argparse.ArgumentParser(description="Transcript Utility")
@@ -274,22 +820,64 @@ def main():
     parser.add_argument('base_name', nargs='?', default='', help="Base name for output files (optional)")
     parser.add_argument('--whisper', choices=['tiny', 'base', 'small', 'medium', 'large'],
                         help="Use local Whisper model instead of OpenAI API")
+    parser.add_argument('--backend', choices=WHISPER_BACKENDS, default='auto',
+                        help="Local Whisper backend (default: mlx on Apple Silicon, then faster-whisper, then openai-whisper)")
     parser.add_argument('--force-download', action='store_true', help="Force download even if the file exists")
+    parser.add_argument('--no-download-cache', dest='use_download_cache', action='store_false',
+                        help="Don't reuse or store YouTube audio in the local download cache")
+    parser.add_argument('--start', type=parse_time, help="Only download YouTube audio from this time (seconds, MM:SS or HH:MM:SS)")
+    parser.add_argument('--end', type=parse_time, help="Only download YouTube audio up to this time (seconds, MM:SS or HH:MM:SS)")
     parser.add_argument('--force-transcribe', action='store_true', help="Force transcription even if the transcript file exists")
+    parser.add_argument('--max-concurrent', type=positive_int, default=DEFAULT_MAX_CONCURRENT,
+                        help="Maximum number of chunks transcribed concurrently with the OpenAI API")
+    parser.add_argument('--fp16', action=argparse.BooleanOptionalAction, default=None,
+                        help="Run the local openai-whisper model in half precision (default: on for GPUs, off for CPU)")
+    parser.add_argument('--no-cache', dest='use_cache', action='store_false',
+                        help="Don't reuse or store OpenAI API chunk transcripts in the local transcript cache")
+    parser.add_argument('--no-silence-split', dest='split_on_silence', action='store_false',
+                        help="Cut OpenAI API chunks at fixed times instead of at pauses in the speech")
+    parser.add_argument('--chain-prompts', action='store_true',
+                        help="Prompt each OpenAI API chunk with the end of the previous one (transcribes chunks in order)")
+    parser.add_argument('--keep-intermediate', action='store_true',
+                        help="Keep per-chunk transcript files next to the final transcript")
+    parser.add_argument('--quantize', action=argparse.BooleanOptionalAction, default=None,
+                        help="Quantize the local openai-whisper model to int8 on CPU (default: on)")
+    parser.add_argument('--compute-type', choices=COMPUTE_TYPES,
+                        help="faster-whisper compute type (default: int8_float16 on CUDA, int8 on CPU)")
+    parser.add_argument('--compile', action='store_true',
+                        help="Compile the local openai-whisper model with torch.compile (pays off on long audio)")
 
     args = parser.parse_args()
+    transcribe_options = {
+        'whisper_model': args.whisper,
+        'max_concurrent': args.max_concurrent,
+        'fp16': args.fp16,
+        'keep_intermediate': args.keep_intermediate,
+        'quantize': args.quantize,
+        'backend': args.backend,
+        'compile_model': args.compile,
+        'compute_type': args.compute_type,
+        'chain_prompts': args.chain_prompts,
+        'use_cache': args.use_cache,
+        'split_on_silence': args.split_on_silence,
+    }
 
     try:
         if args.action == 'y2a':
-            audio_file = YouTubeDownloader.download(args.source, args.base_name, force_download=args.force_download)
+            audio_file = YouTubeDownloader.download(args.source, args.base_name, force_download=args.force_download,
+                                                    start_time=args.start, end_time=args.end,
+                                                    use_download_cache=args.use_download_cache)
             logger.info(f"Audio downloaded: {audio_file}")
             if get_user_choice("Do you want to transcribe this audio? (y/n): "):
-                mp3_to_transcript(audio_file, args.base_name, whisper_model=args.whisper)
+                mp3_to_transcript(audio_file, args.base_name, **transcribe_options)
         elif args.action == 'a2t':
-            transcript_file = mp3_to_transcript(args.source, args.base_name, whisper_model=args.whisper)
+            transcript_file = mp3_to_transcript(args.source, args.base_name, **transcribe_options)
             logger.info(f"Transcript file: {transcript_file}")
         elif args.action == 'y2t':
-            transcript_file = youtube_to_transcript(args.source, args.base_name, whisper_model=args.whisper, force_download=args.force_download)
+            transcript_file = youtube_to_transcript(args.source, args.base_name,
+                                                    force_download=args.force_download,
+                                                    start_time=args.start, end_time=args.end,
+                                                    use_download_cache=args.use_download_cache, **transcribe_options)
             logger.info(f"Transcript file: {transcript_file}")
     except Exception as e:
         logger.error(f"An error occurred: {e}")